@@ -0,0 +1,10 @@
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from src.app import app
+
+
+@pytest_asyncio.fixture(scope="session")
+async def aclient():
+    """Shared async client calling the ASGI app directly on the session event loop"""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
@@ -1,57 +1,81 @@
-import pytest
-from fastapi.testclient import TestClient
-from src.app import app, activities
+from urllib.parse import quote
 
-# Create a test client
-client = TestClient(app)
+import pytest
+import pytest_asyncio
+from src.app import activities, app
+
+# Request URLs keyed by (activity name, HTTP method), quoted once at import
+URLS = {
+    (activity, method): f"/activities/{quote(activity)}/{action}"
+    for activity in ("Chess Club", "Programming Class", "FakeActivity")
+    for method, action in (("POST", "signup"), ("DELETE", "unregister"))
+}
+CHESS_SIGNUP = URLS["Chess Club", "POST"]
+CHESS_UNREGISTER = URLS["Chess Club", "DELETE"]
+PROG_SIGNUP = URLS["Programming Class", "POST"]
+
+# Test input emails, and matching query params, keyed by scenario
+EMAILS = {
+    "new": "newstudent@test.com",
+    "existing": "michael@mergington.edu",
+    "unknown_activity": "test@test.com",
+    "not_signed_up": "notsignedup@test.com",
+    "student": "teststudent@test.com",
+    "integration": "integration@test.com",
+    "multi": "multiactivity@test.com",
+}
+PARAMS = {key: {"email": email} for key, email in EMAILS.items()}
+
+# (HTTP method, participant expected afterwards) for the signup/unregister cycle
+SIGNUP_CYCLE_STEPS = [("POST", True), ("DELETE", False), ("POST", True)]
+
+
+@pytest.fixture(scope="session")
+def _activities_snapshot():
+    """Snapshot the initial participants of every activity once per session"""
+    return {name: tuple(details["participants"]) for name, details in activities.items()}
 
 
 @pytest.fixture
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    original_activities = {
-        name: {
-            "description": details["description"],
-            "schedule": details["schedule"],
-            "max_participants": details["max_participants"],
-            "participants": details["participants"].copy()
-        }
-        for name, details in activities.items()
-    }
+def reset_activities(_activities_snapshot):
+    """Reset activities to initial state after each test"""
     yield
-    # Reset after test
-    for name in activities:
-        activities[name]["participants"] = original_activities[name]["participants"].copy()
+    for name, participants in _activities_snapshot.items():
+        activities[name]["participants"] = list(participants)
+
+
+@pytest.fixture
+def api_req(request):
+    """(method, url, params) for a request row of (method, activity, email key)"""
+    method, activity, email_key = request.param
+    return method, URLS[activity, method], PARAMS[email_key]
+
+
+@pytest_asyncio.fixture(scope="module")
+async def activities_payload(aclient):
+    """Parsed GET /activities response, fetched once for read-only tests"""
+    return (await aclient.get("/activities")).json()
 
 
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
 
-    def test_get_activities_success(self):
+    async def test_get_activities_success(self, aclient):
         """Test successfully fetching all activities"""
-        response = client.get("/activities")
+        response = await aclient.get("/activities")
         assert response.status_code == 200
         data = response.json()
-        assert isinstance(data, dict)
-        assert "Chess Club" in data
-        assert "Programming Class" in data
+        assert {"Chess Club", "Programming Class"} <= data.keys()
 
-    def test_get_activities_has_required_fields(self):
+    async def test_get_activities_has_required_fields(self, activities_payload):
         """Test that activities have all required fields"""
-        response = client.get("/activities")
-        data = response.json()
-        activity = data["Chess Club"]
+        activity = activities_payload["Chess Club"]
         
-        assert "description" in activity
-        assert "schedule" in activity
-        assert "max_participants" in activity
-        assert "participants" in activity
+        assert {"description", "schedule", "max_participants", "participants"} <= activity.keys()
 
-    def test_get_activities_participants_is_list(self):
+    async def test_get_activities_participants_is_list(self, activities_payload):
         """Test that participants field is a list"""
-        response = client.get("/activities")
-        data = response.json()
-        activity = data["Chess Club"]
+        activity = activities_payload["Chess Club"]
         
         assert isinstance(activity["participants"], list)
 
@@ -59,198 +83,141 @@ class TestGetActivities:
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
 
-    def test_signup_success(self, reset_activities):
-        """Test successfully signing up for an activity"""
-        response = client.post(
-            "/activities/Chess%20Club/signup?email=newstudent@test.com"
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert "Signed up" in data["message"]
-        assert "newstudent@test.com" in data["message"]
-
-    def test_signup_adds_participant(self, reset_activities):
+    @pytest.mark.parametrize("api_req,expected_status,expected_body", [
+        (("POST", "Chess Club", "new"), 200,
+         {"message": f"Signed up {EMAILS['new']} for Chess Club"}),
+        (("POST", "Chess Club", "existing"), 400,
+         {"detail": f"Student {EMAILS['existing']} is already signed up for Chess Club"}),
+        (("POST", "FakeActivity", "unknown_activity"), 404, {"detail": "Activity not found"}),
+    ], indirect=["api_req"], ids=["success", "duplicate_email", "nonexistent_activity"])
+    async def test_signup_variants(self, aclient, reset_activities, api_req, expected_status, expected_body):
+        """Test signup responses for new, duplicate and unknown-activity requests"""
+        method, url, params = api_req
+        response = await aclient.request(method, url, params=params)
+        assert response.status_code == expected_status
+        assert response.json() == expected_body
+
+    async def test_signup_adds_participant(self, aclient, reset_activities):
         """Test that signup actually adds participant to list"""
-        response = client.post(
-            "/activities/Chess%20Club/signup?email=newstudent@test.com"
-        )
+        response = await aclient.post(CHESS_SIGNUP, params=PARAMS["new"])
         assert response.status_code == 200
         
         # Verify participant was added
-        activities_response = client.get("/activities")
-        activity_data = activities_response.json()
-        assert "newstudent@test.com" in activity_data["Chess Club"]["participants"]
-
-    def test_signup_duplicate_email(self, reset_activities):
-        """Test that duplicate signups are rejected"""
-        # First signup
-        client.post(
-            "/activities/Chess%20Club/signup?email=duplicate@test.com"
-        )
-        
-        # Attempt duplicate signup
-        response = client.post(
-            "/activities/Chess%20Club/signup?email=duplicate@test.com"
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert "already signed up" in data["detail"]
-
-    def test_signup_nonexistent_activity(self, reset_activities):
-        """Test signup for non-existent activity"""
-        response = client.post(
-            "/activities/FakeActivity/signup?email=test@test.com"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "Activity not found" in data["detail"]
+        assert EMAILS["new"] in activities["Chess Club"]["participants"]
 
-    def test_signup_preserves_existing_participants(self, reset_activities):
+    async def test_signup_preserves_existing_participants(self, aclient, reset_activities):
         """Test that new signup doesn't overwrite existing participants"""
-        # Get initial participant count for Chess Club
-        activities_response = client.get("/activities")
-        initial_participants = activities_response.json()["Chess Club"]["participants"].copy()
+        # Get initial participants for Chess Club
+        participants = activities["Chess Club"]["participants"]
+        initial_participants = set(participants)
         
         # Sign up new student
-        client.post("/activities/Chess%20Club/signup?email=newstudent@test.com")
+        await aclient.post(CHESS_SIGNUP, params=PARAMS["new"])
         
         # Verify all participants are present
-        activities_response = client.get("/activities")
-        final_participants = activities_response.json()["Chess Club"]["participants"]
+        final_participants = set(participants)
         
-        for participant in initial_participants:
-            assert participant in final_participants
-        assert "newstudent@test.com" in final_participants
+        assert initial_participants <= final_participants
+        assert EMAILS["new"] in final_participants
 
 
 class TestUnregisterFromActivity:
     """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
 
-    def test_unregister_success(self, reset_activities):
+    @pytest.mark.parametrize("api_req,expected_status,expected_body", [
+        (("DELETE", "FakeActivity", "unknown_activity"), 404, {"detail": "Activity not found"}),
+        (("DELETE", "Chess Club", "not_signed_up"), 400,
+         {"detail": f"Student {EMAILS['not_signed_up']} is not signed up for Chess Club"}),
+    ], indirect=["api_req"], ids=["nonexistent_activity", "not_signed_up"])
+    async def test_unregister_variants(self, aclient, reset_activities, api_req, expected_status, expected_body):
+        """Test unregister error responses for unknown activities and non-participants"""
+        method, url, params = api_req
+        response = await aclient.request(method, url, params=params)
+        assert response.status_code == expected_status
+        assert response.json() == expected_body
+
+    async def test_unregister_success(self, aclient, reset_activities):
         """Test successfully unregistering from an activity"""
-        # First signup
-        client.post(
-            "/activities/Chess%20Club/signup?email=teststudent@test.com"
-        )
+        # Arrange: student is already signed up
+        activities["Chess Club"]["participants"].append(EMAILS["student"])
         
         # Then unregister
-        response = client.delete(
-            "/activities/Chess%20Club/unregister?email=teststudent@test.com"
-        )
+        response = await aclient.delete(CHESS_UNREGISTER, params=PARAMS["student"])
         assert response.status_code == 200
         data = response.json()
-        assert "Unregistered" in data["message"]
+        assert data["message"] == f"Unregistered {EMAILS['student']} from Chess Club"
 
-    def test_unregister_removes_participant(self, reset_activities):
+    async def test_unregister_removes_participant(self, aclient, reset_activities):
         """Test that unregister actually removes participant"""
-        # Signup
-        client.post(
-            "/activities/Chess%20Club/signup?email=teststudent@test.com"
-        )
+        # Arrange: student is already signed up
+        participants = activities["Chess Club"]["participants"]
+        participants.append(EMAILS["student"])
         
         # Unregister
-        client.delete(
-            "/activities/Chess%20Club/unregister?email=teststudent@test.com"
-        )
+        await aclient.delete(CHESS_UNREGISTER, params=PARAMS["student"])
         
         # Verify participant was removed
-        activities_response = client.get("/activities")
-        activity_data = activities_response.json()
-        assert "teststudent@test.com" not in activity_data["Chess Club"]["participants"]
-
-    def test_unregister_nonexistent_activity(self, reset_activities):
-        """Test unregister from non-existent activity"""
-        response = client.delete(
-            "/activities/FakeActivity/unregister?email=test@test.com"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "Activity not found" in data["detail"]
-
-    def test_unregister_not_signed_up(self, reset_activities):
-        """Test unregistering when not signed up"""
-        response = client.delete(
-            "/activities/Chess%20Club/unregister?email=notsignedup@test.com"
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert "not signed up" in data["detail"]
+        assert EMAILS["student"] not in participants
 
-    def test_unregister_existing_participant(self, reset_activities):
+    async def test_unregister_existing_participant(self, aclient, reset_activities):
         """Test unregistering an existing participant"""
         # Get initial participants
-        activities_response = client.get("/activities")
-        initial_count = len(activities_response.json()["Chess Club"]["participants"])
+        participants = activities["Chess Club"]["participants"]
+        initial_count = len(participants)
         
         # Unregister an existing participant
-        existing_email = activities_response.json()["Chess Club"]["participants"][0]
-        response = client.delete(
-            f"/activities/Chess%20Club/unregister?email={existing_email}"
-        )
+        existing_email = participants[0]
+        response = await aclient.delete(CHESS_UNREGISTER, params={"email": existing_email})
         
         assert response.status_code == 200
         
         # Verify count decreased
-        activities_response = client.get("/activities")
-        final_count = len(activities_response.json()["Chess Club"]["participants"])
+        final_count = len(participants)
         assert final_count == initial_count - 1
 
 
 class TestRootEndpoint:
     """Tests for GET / endpoint"""
 
-    def test_root_redirects(self):
+    async def test_root_redirects(self, aclient):
         """Test that root endpoint redirects"""
-        response = client.get("/", follow_redirects=False)
+        response = await aclient.get("/", follow_redirects=False)
         assert response.status_code == 307
         assert "/static/index.html" in response.headers["location"]
 
+    def test_root_route_redirects(self):
+        """Test the root route's redirect without going through HTTP"""
+        root = next(route for route in app.routes if getattr(route, "path", None) == "/")
+        response = root.endpoint()
+        assert response.status_code == 307
+        assert response.headers["location"] == "/static/index.html"
+
 
+@pytest.mark.integration
 class TestIntegrationScenarios:
     """Integration tests for complete user workflows"""
 
-    def test_signup_unregister_signup_again(self, reset_activities):
+    async def test_signup_unregister_signup_again(self, aclient, reset_activities):
         """Test signing up, unregistering, and signing up again"""
-        email = "integration@test.com"
-        activity = "Programming%20Class"
-        
-        # First signup
-        response1 = client.post(f"/activities/{activity}/signup?email={email}")
-        assert response1.status_code == 200
-        
-        # Verify participant was added
-        activities_response = client.get("/activities")
-        assert email in activities_response.json()["Programming Class"]["participants"]
-        
-        # Unregister
-        response2 = client.delete(f"/activities/{activity}/unregister?email={email}")
-        assert response2.status_code == 200
-        
-        # Verify participant was removed
-        activities_response = client.get("/activities")
-        assert email not in activities_response.json()["Programming Class"]["participants"]
-        
-        # Sign up again
-        response3 = client.post(f"/activities/{activity}/signup?email={email}")
-        assert response3.status_code == 200
+        email = EMAILS["integration"]
+        participants = activities["Programming Class"]["participants"]
         
-        # Verify participant was added again
-        activities_response = client.get("/activities")
-        assert email in activities_response.json()["Programming Class"]["participants"]
+        for step, (method, expected_present) in enumerate(SIGNUP_CYCLE_STEPS):
+            response = await aclient.request(method, URLS["Programming Class", method], params=PARAMS["integration"])
+            assert response.status_code == 200, f"step {step}: {method}"
+            assert (email in participants) is expected_present, f"step {step}: {method}"
 
-    def test_multiple_signups_same_student_different_activities(self, reset_activities):
+    async def test_multiple_signups_same_student_different_activities(self, aclient, reset_activities):
         """Test student can sign up for multiple activities"""
-        email = "multiactivity@test.com"
+        email = EMAILS["multi"]
         
         # Sign up for multiple activities
-        response1 = client.post("/activities/Chess%20Club/signup?email=" + email)
+        response1 = await aclient.post(CHESS_SIGNUP, params=PARAMS["multi"])
         assert response1.status_code == 200
         
-        response2 = client.post("/activities/Programming%20Class/signup?email=" + email)
+        response2 = await aclient.post(PROG_SIGNUP, params=PARAMS["multi"])
         assert response2.status_code == 200
         
         # Verify student is in both activities
-        activities_response = client.get("/activities")
-        data = activities_response.json()
-        assert email in data["Chess Club"]["participants"]
-        assert email in data["Programming Class"]["participants"]
+        assert email in activities["Chess Club"]["participants"]
+        assert email in activities["Programming Class"]["participants"]